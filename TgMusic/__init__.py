@@ -8,11 +8,22 @@ from datetime import datetime
 
 from pytdbot import types, Client
 
+try:
+    import uvloop
+
+    # libuv loop cuts per-await scheduling overhead for the HTTP
+    # streams and callback dispatch; drop-in, so fall back silently.
+    # Installed here because Bot() below creates the event loop at
+    # construction time, under whatever policy is active then.
+    uvloop.install()
+except ImportError:
+    pass
+
 __version__ = "1.2.1"
 StartTime = datetime.now()
 
 
-from TgMusic.core import call, tg, db, config
+from TgMusic.core import call, tg, db, config, close_shared_client
 
 
 class Bot(Client):
@@ -52,10 +63,10 @@ class Bot(Client):
         try:
             await self._initialize_components()
             uptime = self._get_uptime()
-            self.logger.info(f"Bot started successfully in {uptime:.2f} seconds")
-            self.logger.info(f"Version: {self._version}")
+            self.logger.info("Bot started successfully in %.2f seconds", uptime)
+            self.logger.info("Version: %s", self._version)
         except Exception as e:
-            self.logger.critical(f"Failed to start bot: {e}", exc_info=True)
+            self.logger.critical("Failed to start bot: %s", e, exc_info=True)
             raise
 
     async def start_clients(self) -> None:
@@ -86,6 +97,7 @@ class Bot(Client):
             shutdown_tasks = [
                 self.db.close(),
                 self.call_manager.stop_scheduler(),
+                close_shared_client(),
             ]
 
             if graceful:
@@ -93,7 +105,7 @@ class Bot(Client):
             else:
                 await super().stop()
         except Exception as e:
-            self.logger.error(f"Error during shutdown: {e}", exc_info=True)
+            self.logger.error("Error during shutdown: %s", e, exc_info=True)
             raise
 
     def _get_uptime(self) -> float:
@@ -18,6 +18,7 @@ from ._cacher import (
 )
 from ._dataclass import CachedTrack, MusicTrack, PlatformTracks, TrackInfo
 from ._filters import Filter
+from ._httpx import close_shared_client
 from .buttons import SupportButton, control_buttons
 from ._save_cookies import save_all_cookies
 
@@ -41,4 +42,5 @@ __all__ = [
     "PlatformTracks",
     "SupportButton",
     "Filter",
+    "close_shared_client",
 ]
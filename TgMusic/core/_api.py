@@ -2,6 +2,7 @@
 # Licensed under the GNU AGPL v3.0: https://www.gnu.org/licenses/agpl-3.0.html
 # Part of the TgMusicBot project. All rights reserved where applicable.
 
+import functools
 import re
 from pathlib import Path
 from typing import Optional, Union
@@ -12,8 +13,9 @@ from TgMusic.logger import LOGGER
 
 from ._config import config
 from ._downloader import MusicService
-from ._httpx import HttpxClient, SpotifyDownload
+from ._httpx import SpotifyDownload, get_shared_client
 from ._dataclass import PlatformTracks, MusicTrack, TrackInfo
+from ._textutil import sanitize_text
 
 
 class ApiData(MusicService):
@@ -26,22 +28,32 @@ class ApiData(MusicService):
     - Download tracks
     """
 
-    # Platform URL validation patterns
+    # Platform URL validation patterns, applied with fullmatch to sanitized
+    # queries; _sanitize_query already strips any ?query/#fragment tail, so
+    # the patterns carry no anchors or optional query-string branch.
     URL_PATTERNS = {
         "apple_music": re.compile(
-            r"^(https?://)?(music\.apple\.com/([a-z]{2}/)?(album|playlist|song)/[a-zA-Z0-9\-_]+/[0-9]+)(\?.*)?$",
-            re.IGNORECASE,
+            r"(?:https?://)?music\.apple\.com/(?:[a-z]{2}/)?(?:album|playlist|song)/[a-zA-Z0-9\-_]+/[0-9]+",
+            re.IGNORECASE | re.ASCII,
         ),
         "spotify": re.compile(
-            r"^(https?://)?(open\.spotify\.com/(track|playlist|album|artist)/[a-zA-Z0-9]+)(\?.*)?$",
-            re.IGNORECASE,
+            r"(?:https?://)?open\.spotify\.com/(?:track|playlist|album|artist)/[a-zA-Z0-9]+",
+            re.IGNORECASE | re.ASCII,
         ),
         "soundcloud": re.compile(
-            r"^(https?://)?(www\.)?soundcloud\.com/[a-zA-Z0-9_-]+(/(sets)?/[a-zA-Z0-9_-]+)?(\?.*)?$",
-            re.IGNORECASE,
+            r"(?:https?://)?(?:www\.)?soundcloud\.com/[a-zA-Z0-9_-]+(?:/(?:sets)?/[a-zA-Z0-9_-]+)?",
+            re.IGNORECASE | re.ASCII,
         ),
     }
 
+    # Cheap substring hints checked before any regex runs; plain search
+    # queries are rejected without invoking the regex engine at all.
+    _HOST_HINTS = (
+        ("open.spotify.com", "spotify"),
+        ("music.apple.com", "apple_music"),
+        ("soundcloud.com", "soundcloud"),
+    )
+
     def __init__(self, query: Optional[str] = None) -> None:
         """Initialize the API handler with optional query.
 
@@ -49,9 +61,15 @@ class ApiData(MusicService):
             query: URL or search term to process
         """
         self.query = self._sanitize_query(query) if query else None
+        # Quoted once here; _make_api_request may build URLs for the same
+        # query several times (get_info then get_track).
+        self._quoted_query = quote(self.query) if self.query else None
         self.api_url = "https://billa-api.vercel.app"
         self.api_key = config.API_KEY if config.API_KEY else None  # API key is optional
-        self.client = HttpxClient()
+        # Shared across ApiData instances so API calls reuse pooled
+        # connections instead of paying a TCP+TLS handshake per query.
+        self.client = get_shared_client()
+        self._valid_cache: tuple[Optional[str], bool] = (None, False)
 
     @staticmethod
     def _sanitize_query(query: str) -> str:
@@ -64,20 +82,6 @@ class ApiData(MusicService):
         """
         return query.strip().split("?")[0].split("#")[0]
 
-    @staticmethod
-    def _sanitize_text(text: str) -> str:
-        """Sanitize text to prevent Telegram entity parsing issues.
-
-        Escapes HTML characters and removes invalid characters.
-        """
-        if not text:
-            return text
-        # Replace problematic characters
-        text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        # Remove any remaining control characters
-        text = re.sub(r"[\x00-\x1F\x7F]", "", text)
-        return text
-
     def is_valid(self, url: Optional[str]) -> bool:
         """Validate if URL matches supported platform patterns.
 
@@ -89,52 +93,80 @@ class ApiData(MusicService):
         """
         if not url or not self.api_url:
             return False
-        return any(pattern.match(url) for pattern in self.URL_PATTERNS.values())
+        cached_url, cached_result = self._valid_cache
+        if url == cached_url:
+            return cached_result
+        result = False
+        # Lowercase once for the hint scan; the patterns themselves stay
+        # IGNORECASE on the original string.
+        lowered = url.lower()
+        for host, name in self._HOST_HINTS:
+            if host in lowered:
+                # Callers may pass raw URLs; strip ?query/#fragment so the
+                # tail-free patterns can fullmatch.
+                result = (
+                    self.URL_PATTERNS[name].fullmatch(self._sanitize_query(url))
+                    is not None
+                )
+                break
+        self._valid_cache = (url, result)
+        return result
 
     async def _make_api_request(
-            self, endpoint: str, params: Optional[dict] = None
-    ) -> Optional[Union[dict, bytes]]:
+            self, endpoint: str, params: Optional[dict] = None,
+            stream_to: Optional[Path] = None,
+    ) -> Optional[Union[dict, bytes, Path]]:
         """Make API requests to the music service, with optional authentication.
 
         Args:
             endpoint: API endpoint to call
             params: Query parameters for the request
+            stream_to: If set, non-JSON responses are streamed to this path
+                instead of being buffered in memory
 
         Returns:
-            dict or bytes: JSON response or direct file content from API, or None if failed
+            dict, bytes or Path: JSON response, direct file content, or the
+            path a file response was streamed to, or None if failed
         """
         if not self.api_url:
             LOGGER.warning("API URL configuration missing")
             return None
 
         # Construct endpoint URL with path parameter if needed
-        if endpoint in ["search_track", "get_track"] and self.query:
-            request_url = f"{self.api_url}/{endpoint.lstrip('/')}/{quote(self.query)}"
-        elif endpoint == "get_url" and self.query:
-            request_url = f"{self.api_url}/{endpoint.lstrip('/')}/{quote(self.query)}"
+        if self.query and endpoint in ("search_track", "get_track", "get_url"):
+            request_url = f"{self.api_url}/{endpoint}/{self._quoted_query}"
         else:
             request_url = f"{self.api_url}/{endpoint.lstrip('/')}"
 
         headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
 
         try:
-            response = await self.client.make_request(request_url, params=params, headers=headers)
+            if stream_to is not None:
+                response = await self.client.download_bytes_stream(
+                    request_url, stream_to, params=params, headers=headers
+                )
+            else:
+                response = await self.client.make_request(request_url, params=params, headers=headers)
             if response is None:
-                LOGGER.warning(f"API request to {request_url} failed: No response received")
+                LOGGER.warning("API request to %s failed: No response received", request_url)
                 return None
             return response
         except Exception as e:
-            LOGGER.error(f"API request to {request_url} failed: {str(e)}")
+            LOGGER.error("API request to %s failed: %s", request_url, str(e))
             return None
 
-    async def get_info(self) -> Union[PlatformTracks, types.Error]:
+    async def get_info(self, _validated: bool = False) -> Union[PlatformTracks, types.Error]:
         """Retrieve track information from a valid URL.
 
+        Args:
+            _validated: Set when the caller already ran is_valid on the
+                query, skipping a redundant validation pass
+
         Returns:
             PlatformTracks: Contains track metadata
             types.Error: If URL is invalid or request fails
         """
-        if not self.query or not self.is_valid(self.query):
+        if not self.query or not (_validated or self.is_valid(self.query)):
             return types.Error(400, "Invalid or unsupported URL provided")
 
         response = await self._make_api_request("get_url")
@@ -153,7 +185,7 @@ class ApiData(MusicService):
             return types.Error(400, "No search query provided")
 
         if self.is_valid(self.query):
-            return await self.get_info()
+            return await self.get_info(_validated=True)
 
         response = await self._make_api_request("search_track")
         return self._parse_tracks_response(response) or types.Error(
@@ -170,7 +202,9 @@ class ApiData(MusicService):
         if not self.query:
             return types.Error(400, "No track identifier provided")
 
-        response = await self._make_api_request("get_track")
+        response = await self._make_api_request(
+            "get_track", stream_to=config.DOWNLOADS_DIR / f"{self.query}.mp3"
+        )
         if response is None:
             return types.Error(404, f"Track not found for ID: {self.query}")
 
@@ -178,48 +212,44 @@ class ApiData(MusicService):
         if isinstance(response, dict):
             try:
                 return TrackInfo(
-                    url=self._sanitize_text(response.get("spotify_url", f"https://open.spotify.com/track/{self.query}")),
-                    cdnurl=self._sanitize_text(response.get("cdnurl", "")),
-                    key=self._sanitize_text(response.get("key", "")),
-                    name=self._sanitize_text(response.get("name", "Unknown Track")),
-                    artist=self._sanitize_text(", ".join(response.get("artists", ["Unknown Artist"]))),
-                    album=self._sanitize_text(response.get("album", "Unknown Album")),
-                    tc=self._sanitize_text(response.get("tc", self.query)),
-                    cover=self._sanitize_text(response.get("cover", "")),
-                    lyrics=self._sanitize_text(response.get("lyrics", "")),
+                    url=sanitize_text(
+                        response.get("spotify_url")
+                        or f"https://open.spotify.com/track/{self.query}"
+                    ),
+                    cdnurl=sanitize_text(response.get("cdnurl", "")),
+                    key=sanitize_text(response.get("key", "")),
+                    name=sanitize_text(response.get("name", "Unknown Track")),
+                    artist=sanitize_text(", ".join(response.get("artists", ["Unknown Artist"]))),
+                    album=sanitize_text(response.get("album", "Unknown Album")),
+                    tc=sanitize_text(response.get("tc", self.query)),
+                    cover=sanitize_text(response.get("cover", "")),
+                    lyrics=sanitize_text(response.get("lyrics", "")),
                     duration=response.get("duration", 0),
                     year=response.get("year", 0),
                     platform="spotify"
                 )
             except Exception as e:
-                LOGGER.error(f"Error parsing JSON track response for {self.query}: {str(e)}")
+                LOGGER.error("Error parsing JSON track response for %s: %s", self.query, str(e))
                 return types.Error(500, "Failed to process track data")
 
-        # Handle direct MP3 file response
-        if isinstance(response, bytes):
-            temp_file = config.DOWNLOADS_DIR / f"{self.query}.mp3"
-            try:
-                async with aiofiles.open(temp_file, "wb") as f:
-                    await f.write(response)
-                return TrackInfo(
-                    url=f"https://open.spotify.com/track/{self.query}",
-                    cdnurl=str(temp_file),
-                    key="",  # No encryption key for direct MP3
-                    name="Unknown Track",
-                    artist="Unknown Artist",
-                    album="Unknown Album",
-                    tc=self.query,
-                    cover="",
-                    lyrics="",
-                    duration=0,
-                    year=0,
-                    platform="spotify"
-                )
-            except Exception as e:
-                LOGGER.error(f"Error saving MP3 file for track {self.query}: {str(e)}")
-                return types.Error(500, "Failed to process MP3 file")
-
-        LOGGER.warning(f"Unexpected response format for get_track: {type(response)}")
+        # Handle direct MP3 file response (already streamed to disk)
+        if isinstance(response, Path):
+            return TrackInfo(
+                url=f"https://open.spotify.com/track/{self.query}",
+                cdnurl=str(response),
+                key="",  # No encryption key for direct MP3
+                name="Unknown Track",
+                artist="Unknown Artist",
+                album="Unknown Album",
+                tc=self.query,
+                cover="",
+                lyrics="",
+                duration=0,
+                year=0,
+                platform="spotify"
+            )
+
+        LOGGER.warning("Unexpected response format for get_track: %s", type(response))
         return types.Error(500, "Unexpected response format from API")
 
     async def download_track(
@@ -241,7 +271,7 @@ class ApiData(MusicService):
         if track.platform.lower() == "spotify":
             spotify_result = await SpotifyDownload(track).process()
             if isinstance(spotify_result, types.Error):
-                LOGGER.error(f"Spotify download failed: {spotify_result.message}")
+                LOGGER.error("Spotify download failed: %s", spotify_result.message)
             return spotify_result
 
         if not track.cdnurl:
@@ -250,10 +280,15 @@ class ApiData(MusicService):
             return types.Error(400, error_msg)
 
         download_path = config.DOWNLOADS_DIR / f"{track.tc}.mp3"
-        download_result = await self.client.download_file(track.cdnurl, download_path)
+        # overwrite=True revalidates a cached file with If-Modified-Since
+        # instead of trusting it blindly; an unchanged CDN copy comes
+        # back as a 304 with no body transfer.
+        download_result = await self.client.download_file(
+            track.cdnurl, download_path, overwrite=True
+        )
 
         if not download_result.success:
-            LOGGER.warning(f"Download failed for track {track.tc}: {download_result.error}")
+            LOGGER.warning("Download failed for track %s: %s", track.tc, download_result.error)
             return types.Error(500, f"Download failed: {download_result.error or track.tc}")
 
         return download_result.file_path
@@ -275,55 +310,68 @@ class ApiData(MusicService):
             return types.Error(404, "Invalid API response format")
 
         try:
+            # Bind the hot helpers to locals once instead of resolving the
+            # class attribute for every field of every track.
+            sanitize = sanitize_text
+
             # Handle search_track single-object response
             if "id" in response_data:
                 track_data = response_data
                 tracks = [
                     MusicTrack(
-                        url=ApiData._sanitize_text(track_data.get("spotify_url", "")),
-                        name=ApiData._sanitize_text(track_data.get("name", "Unknown Track")),
-                        artist=ApiData._sanitize_text(", ".join(track_data.get("artists", ["Unknown Artist"]))),
+                        url=sanitize(track_data.get("spotify_url", "")),
+                        name=sanitize(track_data.get("name", "Unknown Track")),
+                        artist=sanitize(", ".join(track_data.get("artists", ["Unknown Artist"]))),
                         id=track_data.get("id", ""),
                         year=track_data.get("year", 0),
-                        cover=ApiData._sanitize_text(track_data.get("album_art", "")),
+                        cover=sanitize(track_data.get("album_art", "")),
                         duration=ApiData._parse_duration(track_data.get("duration", 0)),
                         platform="spotify"
                     )
                 ]
             # Handle get_url results list response
             elif "results" in response_data:
-                tracks = [
-                    MusicTrack(
-                        url=ApiData._sanitize_text(track_data.get("spotify_url", "")),
-                        name=ApiData._sanitize_text(track_data.get("name", "Unknown Track")),
-                        artist=ApiData._sanitize_text(track_data.get("artist", "Unknown Artist")),
-                        id=track_data.get("id", ""),
-                        year=track_data.get("year", 0),
-                        cover=ApiData._sanitize_text(track_data.get("cover", "")),
-                        duration=track_data.get("duration", 0),
-                        platform="spotify"
+                tracks = []
+                append = tracks.append
+                for track_data in response_data["results"]:
+                    if not isinstance(track_data, dict):
+                        continue
+                    append(
+                        MusicTrack(
+                            url=sanitize(track_data.get("spotify_url", "")),
+                            name=sanitize(track_data.get("name", "Unknown Track")),
+                            artist=sanitize(track_data.get("artist", "Unknown Artist")),
+                            id=track_data.get("id", ""),
+                            year=track_data.get("year", 0),
+                            cover=sanitize(track_data.get("cover", "")),
+                            duration=track_data.get("duration", 0),
+                            platform="spotify"
+                        )
                     )
-                    for track_data in response_data["results"]
-                    if isinstance(track_data, dict)
-                ]
             else:
                 return types.Error(404, "No valid tracks found in response")
 
             return PlatformTracks(tracks=tracks) if tracks else types.Error(404, "No valid tracks found")
         except Exception as parse_error:
-            LOGGER.error(f"Failed to parse tracks: {parse_error}")
+            LOGGER.error("Failed to parse tracks: %s", parse_error)
             return types.Error(500, "Failed to process track data")
 
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _parse_duration_str(duration: str) -> int:
+        """Convert a MM:SS duration string to seconds, cached per value."""
+        try:
+            minutes, seconds = map(int, duration.split(":"))
+            return minutes * 60 + seconds
+        except ValueError:
+            LOGGER.warning("Invalid duration format: %s", duration)
+            return 0
+
     @staticmethod
     def _parse_duration(duration: Union[str, int]) -> int:
         """Convert duration from string (MM:SS) or integer to seconds."""
-        if isinstance(duration, int):
+        if type(duration) is int:
             return duration
-        if isinstance(duration, str):
-            try:
-                minutes, seconds = map(int, duration.split(":"))
-                return minutes * 60 + seconds
-            except ValueError:
-                LOGGER.warning(f"Invalid duration format: {duration}")
-                return 0
+        if type(duration) is str:
+            return ApiData._parse_duration_str(duration)
         return 0
@@ -2,18 +2,64 @@
 # Licensed under the GNU AGPL v3.0: https://www.gnu.org/licenses/agpl-3.0.html
 # Part of the TgMusicBot project. All rights reserved where applicable.
 
-from collections import deque
-from typing import Any, Optional, TypeAlias, Union
-from html import escape
-import re
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Generic, Optional, TypeAlias, TypeVar, Union
 
 from cachetools import TTLCache
 from pytdbot import types
 
 from TgMusic.core._dataclass import CachedTrack
+from TgMusic.core._textutil import sanitize_message_text
 
 chat_invite_cache = TTLCache(maxsize=1000, ttl=1000)
 
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+class TTLMap(Generic[_K, _V]):
+    """Dict-like TTL cache on time.monotonic with LRU eviction.
+
+    Lean replacement for cachetools.TTLCache on the event-loop hot path:
+    no per-access lock, no expired-entry sweeps — a get or set is one
+    OrderedDict operation plus a monotonic() call, entries expire lazily
+    on access and the least recently used one is dropped past maxsize.
+    """
+
+    __slots__ = ("_data", "_maxsize", "_ttl")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._data: OrderedDict[_K, tuple[_V, float]] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get(self, key: _K, default: Optional[_V] = None) -> Optional[_V]:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        value, expiry = item
+        if monotonic() >= expiry:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: _K, value: _V) -> None:
+        data = self._data
+        data[key] = (value, monotonic() + self._ttl)
+        data.move_to_end(key)
+        if len(data) > self._maxsize:
+            data.popitem(last=False)
+
+    def __contains__(self, key: _K) -> bool:
+        return self.get(key) is not None
+
+    def pop(self, key: _K, default: Optional[_V] = None) -> Optional[_V]:
+        item = self._data.pop(key, None)
+        return item[0] if item is not None else default
+
+
 ChatMemberStatus: TypeAlias = Union[
     types.ChatMemberStatusCreator,
     types.ChatMemberStatusAdministrator,
@@ -24,99 +70,141 @@ ChatMemberStatus: TypeAlias = Union[
 ]
 
 ChatMemberStatusResult: TypeAlias = Union[ChatMemberStatus, types.Error]
-user_status_cache: TTLCache[str, ChatMemberStatus] = TTLCache(maxsize=5000, ttl=1000)
+user_status_cache: TTLMap[str, ChatMemberStatus] = TTLMap(maxsize=5000, ttl=1000)
 
 
 class ChatCacher:
+    """Per-chat playback state.
+
+    Queues are stored as a plain list plus a moving ``head`` index: the
+    playing track is ``queue[head]``, dequeuing just advances ``head``
+    (O(1), no element shifting), and the consumed prefix is compacted
+    away once it outgrows the live part.
+    """
+
     def __init__(self):
         self.chat_cache: dict[int, dict[str, Any]] = {}
+        # Mirrors the is_active flags so get_active_chats is O(1) instead
+        # of a full scan over every tracked chat.
+        self._active: set[int] = set()
 
     @staticmethod
-    def _sanitize_text(text: str) -> str:
-        """Sanitize text to prevent Telegram entity parsing issues.
-
-        Escapes HTML characters and removes invalid characters.
-        """
-        if not text:
-            return text or ""
-        # Escape HTML characters
-        text = escape(text)
-        # Remove control characters
-        text = re.sub(r"[\x00-\x1F\x7F]", "", text)
-        # Truncate to Telegram message length limit
-        return text[:4096]
+    def _new_entry(active: bool = True) -> dict[str, Any]:
+        return {"is_active": active, "queue": [], "head": 0}
 
     def add_song(self, chat_id: int, song: CachedTrack) -> CachedTrack:
         """Add a song to the chat queue with sanitized fields."""
-        # Sanitize text fields and provide defaults for missing fields
-        sanitized_song = CachedTrack(
-            track_id=song.track_id,
-            name=self._sanitize_text(song.name),
-            url=self._sanitize_text(song.url),
-            user=self._sanitize_text(song.user),
-            platform=song.platform,
-            duration=song.duration,
-            is_video=song.is_video,
-            file_path=song.file_path,
-            loop=song.loop,
-            artist=self._sanitize_text(getattr(song, 'artist', 'Unknown Artist')),
-            thumbnail=self._sanitize_text(getattr(song, 'thumbnail', ''))
-        )
-        data = self.chat_cache.setdefault(chat_id, {"is_active": True, "queue": deque()})
-        data["queue"].append(sanitized_song)
-        return sanitized_song
+        # Sanitize the text fields in place instead of rebuilding the model
+        sanitize = sanitize_message_text
+        song.name = sanitize(song.name)
+        song.url = sanitize(song.url)
+        song.user = sanitize(song.user)
+        song.artist = sanitize(getattr(song, "artist", "Unknown Artist"))
+        song.thumbnail = sanitize(getattr(song, "thumbnail", ""))
+        data = self.chat_cache.get(chat_id)
+        if data is None:
+            data = self.chat_cache[chat_id] = self._new_entry()
+        if data["is_active"]:
+            self._active.add(chat_id)
+        data["queue"].append(song)
+        return song
 
     def get_upcoming_track(self, chat_id: int) -> Optional[CachedTrack]:
-        queue = self.chat_cache.get(chat_id, {}).get("queue")
-        return queue[1] if queue and len(queue) > 1 else None
+        data = self.chat_cache.get(chat_id)
+        if not data:
+            return None
+        queue, head = data["queue"], data["head"]
+        return queue[head + 1] if head + 1 < len(queue) else None
 
     def get_playing_track(self, chat_id: int) -> Optional[CachedTrack]:
-        queue = self.chat_cache.get(chat_id, {}).get("queue")
-        return queue[0] if queue else None
+        data = self.chat_cache.get(chat_id)
+        if not data:
+            return None
+        queue, head = data["queue"], data["head"]
+        return queue[head] if head < len(queue) else None
 
     def remove_current_song(self, chat_id: int) -> Optional[CachedTrack]:
-        queue = self.chat_cache.get(chat_id, {}).get("queue")
-        return queue.popleft() if queue else None
+        data = self.chat_cache.get(chat_id)
+        if not data:
+            return None
+        queue, head = data["queue"], data["head"]
+        if head >= len(queue):
+            return None
+        song = queue[head]
+        head += 1
+        # Compact once the consumed prefix outgrows the live part
+        if head * 2 > len(queue):
+            del queue[:head]
+            head = 0
+        data["head"] = head
+        return song
 
     def is_active(self, chat_id: int) -> bool:
-        return self.chat_cache.get(chat_id, {}).get("is_active", False)
+        data = self.chat_cache.get(chat_id)
+        return data["is_active"] if data else False
 
     def set_active(self, chat_id: int, active: bool):
-        data = self.chat_cache.setdefault(chat_id, {"is_active": active, "queue": deque()})
-        data["is_active"] = active
+        data = self.chat_cache.get(chat_id)
+        if data is None:
+            self.chat_cache[chat_id] = self._new_entry(active)
+        else:
+            data["is_active"] = active
+        if active:
+            self._active.add(chat_id)
+        else:
+            self._active.discard(chat_id)
 
     def clear_chat(self, chat_id: int):
         self.chat_cache.pop(chat_id, None)
+        self._active.discard(chat_id)
+
+    def prune_inactive(self) -> int:
+        """Drop entries for chats with no active playback.
+
+        Chats the bot has left (or that simply stopped playing) otherwise
+        keep their last queue alive forever; an hourly maintenance job
+        calls this to bound memory on long uptimes.
+        """
+        stale = [
+            chat_id
+            for chat_id, data in self.chat_cache.items()
+            if not data["is_active"]
+        ]
+        for chat_id in stale:
+            del self.chat_cache[chat_id]
+            self._active.discard(chat_id)
+        return len(stale)
 
     def get_queue_length(self, chat_id: int) -> int:
-        return len(self.chat_cache.get(chat_id, {}).get("queue", deque()))
+        data = self.chat_cache.get(chat_id)
+        return len(data["queue"]) - data["head"] if data else 0
 
     def get_loop_count(self, chat_id: int) -> int:
-        queue = self.chat_cache.get(chat_id, {}).get("queue", deque())
-        return queue[0].loop if queue else 0
+        track = self.get_playing_track(chat_id)
+        return track.loop if track else 0
 
     def set_loop_count(self, chat_id: int, loop: int) -> bool:
-        if queue := self.chat_cache.get(chat_id, {}).get("queue", deque()):
-            queue[0].loop = loop
+        if track := self.get_playing_track(chat_id):
+            track.loop = loop
             return True
         return False
 
     def remove_track(self, chat_id: int, queue_index: int) -> bool:
-        queue = self.chat_cache.get(chat_id, {}).get("queue")
-        if queue and 0 <= queue_index < len(queue):
-            queue_list = list(queue)
-            queue_list.pop(queue_index)
-            self.chat_cache[chat_id]["queue"] = deque(queue_list)
+        data = self.chat_cache.get(chat_id)
+        if not data:
+            return False
+        queue, head = data["queue"], data["head"]
+        if 0 <= queue_index < len(queue) - head:
+            del queue[head + queue_index]
             return True
         return False
 
     def get_queue(self, chat_id: int) -> list[CachedTrack]:
-        return list(self.chat_cache.get(chat_id, {}).get("queue", deque()))
+        data = self.chat_cache.get(chat_id)
+        return data["queue"][data["head"]:] if data else []
 
     def get_active_chats(self) -> list[int]:
-        return [
-            chat_id for chat_id, data in self.chat_cache.items() if data["is_active"]
-        ]
+        return list(self._active)
 
 
 chat_cache = ChatCacher()
@@ -24,6 +24,9 @@ class Database:
         self.chat_cache = TTLCache(maxsize=1000, ttl=1200)
         self.bot_cache = TTLCache(maxsize=1000, ttl=1200)
         self.lang_cache = TTLCache(maxsize=1000, ttl=1200)
+        # channel_id -> chat_id (or None when unmapped); queried for every
+        # active chat each minute by the inactive-call sweep
+        self.channel_cache = TTLCache(maxsize=1000, ttl=300)
 
     async def ping(self) -> None:
         try:
@@ -84,15 +87,26 @@ class Database:
         return channel_id if channel_id is not None else chat_id
 
     async def set_channel_id(self, chat_id: int, channel_id: Union[int, None]) -> None:
+        # Drop the reverse mapping for the previous channel, if we know it
+        old_channel = (self.chat_cache.get(chat_id) or {}).get("channel_id")
+        if old_channel is not None:
+            self.channel_cache.pop(old_channel, None)
         await self._update_chat_field(chat_id, "channel_id", channel_id)
+        if channel_id is not None:
+            self.channel_cache[channel_id] = chat_id
 
     async def get_chat_id_by_channel(self, channel_id: int) -> Optional[int]:
         """
         Find the chat ID associated with the given channel ID.
         """
+        if channel_id in self.channel_cache:
+            return self.channel_cache[channel_id]
         try:
             chat = await self.chat_db.find_one({"channel_id": channel_id})
-            return chat["_id"] if chat else None
+            chat_id = chat["_id"] if chat else None
+            # Cache None too: most lookups are for unmapped chats
+            self.channel_cache[channel_id] = chat_id
+            return chat_id
         except Exception as e:
             LOGGER.warning("Error getting chat_id by channel_id: %s", e)
             return None
@@ -108,7 +122,7 @@ class Database:
             if "assistant" in self.chat_cache[chat_id]:
                 self.chat_cache[chat_id]["assistant"] = None
 
-        LOGGER.info(f"Cleared assistants from {result.modified_count} chats")
+        LOGGER.info("Cleared assistants from %s chats", result.modified_count)
         return result.modified_count
 
     async def remove_assistant(self, chat_id: int) -> None:
@@ -204,8 +218,9 @@ class Database:
         self.bot_cache[bot_id] = cached
 
     async def get_auto_end(self, bot_id: int) -> bool:
-        if bot_id in self.bot_cache and self.bot_cache[bot_id].get("auto_end"):
-            return self.bot_cache[bot_id].get("auto_end")
+        cached_bot = self.bot_cache.get(bot_id)
+        if cached_bot is not None and "auto_end" in cached_bot:
+            return cached_bot["auto_end"]
 
         bot_data = await self.bot_db.find_one({"_id": bot_id})
         status = bot_data.get("auto_end", True) if bot_data else True
@@ -2,12 +2,13 @@
 #  Licensed under the GNU AGPL v3.0: https://www.gnu.org/licenses/agpl-3.0.html
 #  Part of the TgMusicBot project. All rights reserved where applicable.
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 
-from pydantic import BaseModel
 
-class CachedTrack(BaseModel):
+@dataclass(slots=True)
+class CachedTrack:
     url: str
     name: str
     artist: str
@@ -16,12 +17,13 @@ class CachedTrack(BaseModel):
     file_path: Union[str, Path]
     thumbnail: str
     track_id: str
-    duration: int = 0
     is_video: bool
     platform: str
+    duration: int = 0
 
 
-class TrackInfo(BaseModel):
+@dataclass(slots=True)
+class TrackInfo:
     url: str
     cdnurl: str
     key: str
@@ -36,7 +38,8 @@ class TrackInfo(BaseModel):
     platform: str
 
 
-class MusicTrack(BaseModel):
+@dataclass(slots=True)
+class MusicTrack:
     url: str
     name: str
     artist: str
@@ -46,6 +49,21 @@ class MusicTrack(BaseModel):
     duration: int
     platform: str
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MusicTrack":
+        """Build a track from a formatter dict, ignoring extra keys."""
+        return cls(
+            url=data.get("url", ""),
+            name=data.get("name", "Unknown Title"),
+            artist=data.get("artist", "Unknown Artist"),
+            id=data.get("id", ""),
+            year=int(data.get("year") or 0),
+            cover=data.get("cover", ""),
+            duration=int(data.get("duration") or 0),
+            platform=data.get("platform", ""),
+        )
+
 
-class PlatformTracks(BaseModel):
+@dataclass(slots=True)
+class PlatformTracks:
     tracks: list[MusicTrack]
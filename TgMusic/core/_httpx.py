@@ -3,22 +3,26 @@
 # Part of the TgMusicBot project. All rights reserved where applicable.
 
 import asyncio
+import os
+import random
 import re
+import subprocess
 import time
 import uuid
 from dataclasses import dataclass
+from email.utils import formatdate
 from pathlib import Path
-from typing import Any, Optional, Union, Dict
+from typing import Any, AsyncIterator, Optional, Union, Dict
 from urllib.parse import unquote
 
-import aiofiles
 import httpx
-from Crypto.Cipher import AES
-from Crypto.Util import Counter
+import ujson
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from pytdbot import types
 
 from TgMusic.logger import LOGGER
 
+from ._cacher import TTLMap
 from ._config import config
 from ._dataclass import TrackInfo
 
@@ -31,6 +35,115 @@ class DownloadResult:
     status_code: Optional[int] = None
 
 
+# Byte patches rebuild_ogg applies to fix broken OGG headers; the same
+# table is applied in memory to the first bytes of the streamed pipeline.
+_OGG_HEADER_PATCHES = (
+    (0, b"OggS"),
+    (6, b"\x00" * 10),
+    (26, b"\x01\x1e\x01vorbis"),
+    (39, b"\x02"),
+    (40, b"\x44\xac\x00\x00"),
+    (48, b"\x00\xe2\x04\x00"),
+    (56, b"\xb8\x01"),
+    (58, b"OggS"),
+    (62, b"\x00" * 10),
+)
+_OGG_PATCH_LEN = 72  # last patch ends at offset 62 + 10
+
+# Fixed AES-CTR IV used by the Spotify CDN; a constant, so decoded once
+# at import instead of per track.
+_SPOTIFY_IV = bytes.fromhex("72e067fbddcbcf77ebe8bc643f630d93")
+
+# Characters stripped from server-provided filenames; compiled once so
+# _sanitize_filename skips the re-cache lookup on every download.
+_UNSAFE_FN = re.compile(r'[<>:"/\\|?*]')
+
+# Cap on concurrent make_request calls so a burst of retries cannot
+# exhaust the connection pool or hammer a rate-limited API.
+_REQUEST_SEM = asyncio.Semaphore(64)
+
+
+def _patch_ogg_header(buffer: bytearray) -> None:
+    """Apply the OGG header fixes in place on a buffered prefix."""
+    for offset, data in _OGG_HEADER_PATCHES:
+        buffer[offset:offset + len(data)] = data
+
+
+def _valid_patched_prefix(prefix: bytearray) -> bool:
+    """Sanity-check a patched prefix via bytes the patch does not write.
+
+    The patch table forces the OggS and vorbis magics, so testing those
+    would accept any input. A correctly decrypted stream instead pins
+    down fields the patches leave untouched: the page structure version
+    (always 0), the beginning-of-stream flag on the first page, and the
+    vorbis_version field inside the identification packet (always 0).
+    A wrong key or a non-OGG payload leaves pseudo-random bytes here, so
+    the caller can fall back to the FFmpeg remux, which probes properly.
+    """
+    return (
+        prefix[4] == 0
+        and prefix[5] == 0x02
+        and prefix[35:39] == b"\x00\x00\x00\x00"
+    )
+
+
+def _rebuild_ogg_sync(filename: str) -> None:
+    """Read the header prefix, patch it in memory, write it back once."""
+    fd = os.open(filename, os.O_RDWR)
+    try:
+        prefix = bytearray(os.pread(fd, _OGG_PATCH_LEN, 0))
+        if len(prefix) < _OGG_PATCH_LEN:
+            prefix.extend(b"\x00" * (_OGG_PATCH_LEN - len(prefix)))
+        _patch_ogg_header(prefix)
+        os.pwrite(fd, bytes(prefix), 0)
+    finally:
+        os.close(fd)
+
+
+# Flush threshold for batched download writes; a few chunks are queued
+# and written with one writev so each batch costs a single thread-pool
+# hop instead of one per chunk.
+_WRITE_BATCH_BYTES = 4 * 1024 * 1024
+
+
+def _writev_all(fd: int, buffers: list) -> None:
+    """writev ``buffers`` to ``fd``, resuming after partial writes."""
+    while buffers:
+        written = os.writev(fd, buffers)
+        while buffers and written >= len(buffers[0]):
+            written -= len(buffers[0])
+            buffers.pop(0)
+        if written:
+            buffers[0] = buffers[0][written:]
+
+
+async def _write_stream_to(path: str, chunks: AsyncIterator[bytes]) -> int:
+    """Write an async chunk stream to ``path`` with batched flushes.
+
+    Returns the number of bytes written.
+    """
+    total = 0
+    batch: list = []
+    buffered = 0
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            batch.append(chunk)
+            buffered += len(chunk)
+            total += len(chunk)
+            if buffered >= _WRITE_BATCH_BYTES:
+                await asyncio.to_thread(_writev_all, fd, batch)
+                batch = []
+                buffered = 0
+        if batch:
+            await asyncio.to_thread(_writev_all, fd, batch)
+    finally:
+        await asyncio.to_thread(os.close, fd)
+    return total
+
+
 async def rebuild_ogg(filename: str) -> None:
     """
     Fixes broken OGG headers.
@@ -40,33 +153,7 @@ async def rebuild_ogg(filename: str) -> None:
         return
 
     try:
-        async with aiofiles.open(filename, "r+b") as ogg_file:
-            ogg_s = b"OggS"
-            zeroes = b"\x00" * 10
-            vorbis_start = b"\x01\x1e\x01vorbis"
-            channels = b"\x02"
-            sample_rate = b"\x44\xac\x00\x00"
-            bit_rate = b"\x00\xe2\x04\x00"
-            packet_sizes = b"\xb8\x01"
-
-            await ogg_file.seek(0)
-            await ogg_file.write(ogg_s)
-            await ogg_file.seek(6)
-            await ogg_file.write(zeroes)
-            await ogg_file.seek(26)
-            await ogg_file.write(vorbis_start)
-            await ogg_file.seek(39)
-            await ogg_file.write(channels)
-            await ogg_file.seek(40)
-            await ogg_file.write(sample_rate)
-            await ogg_file.seek(48)
-            await ogg_file.write(bit_rate)
-            await ogg_file.seek(56)
-            await ogg_file.write(packet_sizes)
-            await ogg_file.seek(58)
-            await ogg_file.write(ogg_s)
-            await ogg_file.seek(62)
-            await ogg_file.write(zeroes)
+        await asyncio.to_thread(_rebuild_ogg_sync, filename)
     except Exception as e:
         LOGGER.error("Error rebuilding OGG file %s: %s", filename, e)
 
@@ -96,6 +183,7 @@ class HttpxClient:
             ),
             follow_redirects=max_redirects > 0,
             max_redirects=max_redirects,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
         )
 
     async def close(self) -> None:
@@ -137,11 +225,35 @@ class HttpxClient:
             return DownloadResult(success=False, error=error_msg)
 
         headers = self._get_headers(url, kwargs.pop("headers", {}))
+        # Audio does not compress; requesting the identity encoding lets
+        # aiter_raw hand over the wire bytes without a decode pass.
+        headers.setdefault("Accept-Encoding", "identity")
+
+        if file_path is not None:
+            path = Path(file_path) if isinstance(file_path, str) else file_path
+            if path.exists():
+                if not overwrite:
+                    # Known target already on disk: skip the request
+                    LOGGER.debug("File already exists at %s and overwrite=False", path)
+                    return DownloadResult(success=True, file_path=path)
+                # Revalidate instead of unconditionally refetching; a 304
+                # below keeps the cached copy without transferring bytes
+                headers.setdefault(
+                    "If-Modified-Since",
+                    formatdate(path.stat().st_mtime, usegmt=True),
+                )
+        else:
+            path = None
 
         try:
             async with self._session.stream(
                 "GET", url, timeout=self._download_timeout, headers=headers
             ) as response:
+                if response.status_code == 304 and path is not None:
+                    # Server says the cached copy is still current
+                    LOGGER.debug("Cached file at %s is still fresh (304)", path)
+                    return DownloadResult(success=True, file_path=path)
+
                 if not response.is_success:
                     error_msg = await self._parse_error_response(response)
                     LOGGER.error(
@@ -154,41 +266,47 @@ class HttpxClient:
                         success=False, error=error_msg, status_code=response.status_code
                     )
 
-                if file_path is None:
+                if path is None:
+                    # Plain partition/strip beats a regex for this short
+                    # header: no compiled pattern, no Match allocation.
                     cd = response.headers.get("Content-Disposition", "")
-                    match = re.search(r'filename="?([^"]+)"?', cd)
+                    _, _, tail = cd.partition("filename=")
+                    filename = tail.split(";", 1)[0].strip().strip('"') if tail else ""
                     filename = (
-                        unquote(match[1])
-                        if match
+                        unquote(filename)
+                        if filename
                         else Path(url).name or f"{uuid.uuid4().hex}.tmp"
                     )
                     path = config.DOWNLOADS_DIR / self._sanitize_filename(filename)
-                else:
-                    path = Path(file_path) if isinstance(file_path, str) else file_path
 
-                if path.exists() and not overwrite:
-                    LOGGER.debug("File already exists at %s and overwrite=False", path)
-                    return DownloadResult(success=True, file_path=path)
+                    if path.exists() and not overwrite:
+                        LOGGER.debug(
+                            "File already exists at %s and overwrite=False", path
+                        )
+                        return DownloadResult(success=True, file_path=path)
 
                 # Write to temp file first
                 temp_path = path.with_suffix(f"{path.suffix}.part")
                 path.parent.mkdir(parents=True, exist_ok=True)
+                temp_str, path_str = str(temp_path), str(path)
 
                 try:
-                    async with aiofiles.open(temp_path, "wb") as f:
-                        async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
-                            await f.write(chunk)
+                    total = await _write_stream_to(
+                        temp_str, response.aiter_raw(self.CHUNK_SIZE)
+                    )
                 except Exception as e:
-                    if temp_path.exists():
-                        await os.remove(temp_path)
+                    if os.path.exists(temp_str):
+                        await asyncio.to_thread(os.remove, temp_str)
                     raise e
 
-                temp_path.rename(path)
+                # Atomic and cheaper than Path.rename; the byte count comes
+                # from the write loop, saving the final stat() as well.
+                os.replace(temp_str, path_str)
 
                 LOGGER.info(
                     "Successfully downloaded file to %s (size: %d bytes)",
                     path,
-                    path.stat().st_size,
+                    total,
                 )
                 return DownloadResult(success=True, file_path=path)
 
@@ -215,10 +333,107 @@ class HttpxClient:
             LOGGER.error(error_msg, exc_info=True)
             return DownloadResult(success=False, error=error_msg)
 
+    async def download_bytes_stream(
+        self,
+        url: str,
+        file_path: Union[str, Path],
+        **kwargs: Any,
+    ) -> Optional[Union[Dict[str, Any], Path]]:
+        """Fetch a URL that may answer with JSON metadata or a raw file.
+
+        JSON responses are parsed and returned as a dict. Anything else is
+        streamed to ``file_path`` chunk-by-chunk, so large files never sit
+        fully in memory; the saved Path is returned instead.
+
+        Returns None on failure.
+        """
+        if not url:
+            LOGGER.error("Empty URL provided")
+            return None
+
+        headers = self._get_headers(url, kwargs.pop("headers", {}))
+
+        try:
+            async with self._session.stream(
+                "GET", url, timeout=self._download_timeout, headers=headers, **kwargs
+            ) as response:
+                if not response.is_success:
+                    await response.aread()
+                    error_msg = await self._parse_error_response(response)
+                    LOGGER.error(
+                        "Request to %s failed with status %d: %s",
+                        url,
+                        response.status_code,
+                        error_msg,
+                    )
+                    return None
+
+                content_type = response.headers.get("content-type", "").lower()
+                if "application/json" in content_type:
+                    return ujson.loads(await response.aread())
+
+                path = Path(file_path) if isinstance(file_path, str) else file_path
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_suffix(f"{path.suffix}.part")
+                temp_str = str(temp_path)
+                await _write_stream_to(
+                    temp_str, response.aiter_bytes(self.CHUNK_SIZE)
+                )
+                os.replace(temp_str, str(path))
+                return path
+
+        except Exception as e:
+            LOGGER.error("Error streaming %s: %s", url, e, exc_info=True)
+            return None
+
+    async def stream_chunks(
+        self,
+        url: str,
+        chunk_size: int = CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """Yield the response body of ``url`` chunk by chunk.
+
+        Raises httpx.HTTPStatusError on a non-success response so callers
+        can surface the failure instead of processing a partial stream.
+        """
+        headers = self._get_headers(url, kwargs.pop("headers", {}))
+        headers.setdefault("Accept-Encoding", "identity")
+        async with self._session.stream(
+            "GET", url, timeout=self._download_timeout, headers=headers, **kwargs
+        ) as response:
+            if not response.is_success:
+                await response.aread()
+                error_msg = await self._parse_error_response(response)
+                raise httpx.HTTPStatusError(
+                    error_msg, request=response.request, response=response
+                )
+            async for chunk in response.aiter_raw(chunk_size):
+                yield chunk
+
+    @staticmethod
+    def _retry_delay(
+        response: Optional[httpx.Response], attempt: int, backoff_factor: float
+    ) -> float:
+        """Jittered exponential backoff, honoring Retry-After if sent.
+
+        Jitter desynchronizes clients retrying the same endpoint so they
+        do not re-arrive in lockstep after an outage.
+        """
+        delay = backoff_factor * (2**attempt) * random.uniform(0.5, 1.5)
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    delay = max(delay, float(retry_after))
+                except ValueError:
+                    pass
+        return delay
+
     @staticmethod
     def _sanitize_filename(name: str) -> str:
         """Sanitize filename to remove unsafe characters."""
-        return re.sub(r'[<>:"/\\|?*]', "", name).strip()
+        return _UNSAFE_FN.sub("", name).strip()
 
     async def make_request(
         self,
@@ -237,7 +452,8 @@ class HttpxClient:
         for attempt in range(max_retries):
             try:
                 start = time.monotonic()
-                response = await self._session.get(url, headers=headers, **kwargs)
+                async with _REQUEST_SEM:
+                    response = await self._session.get(url, headers=headers, **kwargs)
                 duration = time.monotonic() - start
 
                 if not response.is_success:
@@ -252,7 +468,9 @@ class HttpxClient:
                     )
                     last_error = error_msg
                     if attempt < max_retries - 1:
-                        await asyncio.sleep(backoff_factor * (2**attempt))
+                        await asyncio.sleep(
+                            self._retry_delay(response, attempt, backoff_factor)
+                        )
                     continue
 
                 LOGGER.debug(
@@ -264,7 +482,9 @@ class HttpxClient:
                 # Check content type to determine if response is JSON or raw bytes
                 content_type = response.headers.get("content-type", "").lower()
                 if "application/json" in content_type:
-                    return response.json()
+                    # ujson's C parser is noticeably faster than the stdlib
+                    # json httpx uses for large search/playlist responses
+                    return ujson.loads(response.content)
                 else:
                     return response.content  # Return raw bytes for MP3 file
 
@@ -278,7 +498,9 @@ class HttpxClient:
                     last_error,
                 )
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(backoff_factor * (2**attempt))
+                    await asyncio.sleep(
+                        self._retry_delay(None, attempt, backoff_factor)
+                    )
 
             except ValueError as e:
                 last_error = f"Invalid JSON response: {str(e)}"
@@ -303,80 +525,202 @@ class HttpxClient:
         return None
 
 
+# One client (and thus one connection pool) for the whole process; a
+# per-track HttpxClient would pay a fresh TCP+TLS handshake per download.
+_shared_client: Optional[HttpxClient] = None
+
+
+def get_shared_client() -> HttpxClient:
+    """Return the process-wide HttpxClient, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = HttpxClient()
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared client's pooled connections at shutdown."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
+
+
+# Output paths produced recently; replaying the same track within the
+# TTL skips the stat() in SpotifyDownload.process.
+_produced_outputs: TTLMap[str, bool] = TTLMap(maxsize=1024, ttl=600)
+
+# Cap on concurrent FFmpeg processes; beyond this the fork/exec and
+# libavcodec init overhead plus CPU contention make remuxes slower than
+# letting them queue.
+_FFMPEG_SEM = asyncio.Semaphore(max(2, (os.cpu_count() or 2) // 2))
+
+
 class SpotifyDownload:
     def __init__(self, track: TrackInfo):
         self.track = track
-        self.encrypted_file = os.path.join(
-            config.DOWNLOADS_DIR, f"{track.tc}.encrypted.ogg"
-        )
-        self.decrypted_file = os.path.join(
-            config.DOWNLOADS_DIR, f"{track.tc}.decrypted.ogg"
-        )
-        self.output_file = os.path.join(config.DOWNLOADS_DIR, f"{track.tc}.mp3")  # Use .mp3 for direct downloads
-
-    async def decrypt_audio(self) -> None:
-        """
-        Decrypt the downloaded audio file using a stream-based approach.
+        # Single Path join; encrypted tracks come out of the pipeline as
+        # OGG (Telegram accepts it), direct downloads stay .mp3
+        ext = "ogg" if track.key else "mp3"
+        self.output_file = str(config.DOWNLOADS_DIR / f"{track.tc}.{ext}")
+
+    async def _stream_decrypt(self) -> bool:
+        """Fast path for encrypted tracks: decrypt straight to the output.
+
+        ffmpeg -c copy only rewraps the container, so when the patched
+        prefix passes the structural sanity check the fork/exec and
+        libavformat probe are pure overhead. Streams the decrypted,
+        header-patched bytes directly to the .ogg output; returns False
+        without producing output if the prefix does not validate, in
+        which case the caller falls back to the FFmpeg remux.
         """
-        try:
-            key = bytes.fromhex(self.track.key)
-            iv = bytes.fromhex("72e067fbddcbcf77ebe8bc643f630d93")
-            iv_int = int.from_bytes(iv, "big")
-            cipher = AES.new(
-                key, AES.MODE_CTR, counter=Counter.new(128, initial_value=iv_int)
-            )
+        key = bytes.fromhex(self.track.key)
+        decryptor = Cipher(algorithms.AES(key), modes.CTR(_SPOTIFY_IV)).decryptor()
+        temp_str = f"{self.output_file}.part"
+        valid = True
+
+        async def decrypted() -> AsyncIterator[bytes]:
+            nonlocal valid
+            prefix = bytearray()
+            prefix_done = False
+            async for chunk in get_shared_client().stream_chunks(self.track.cdnurl):
+                data = decryptor.update(chunk)
+                if not prefix_done:
+                    prefix.extend(data)
+                    if len(prefix) < _OGG_PATCH_LEN:
+                        continue
+                    _patch_ogg_header(prefix)
+                    if not _valid_patched_prefix(prefix):
+                        valid = False
+                        return
+                    data = bytes(prefix)
+                    prefix_done = True
+                yield data
+            decryptor.finalize()
+            if not prefix_done:
+                # Stream too short to even fill the patch region
+                valid = False
 
-            chunk_size = 8192  # 8KB chunks
-            async with (
-                aiofiles.open(self.encrypted_file, "rb") as fin,
-                aiofiles.open(self.decrypted_file, "wb") as fout,
-            ):
-                while chunk := await fin.read(chunk_size):
-                    decrypted_chunk = cipher.decrypt(chunk)
-                    await fout.write(decrypted_chunk)  # Fixed typo: await-blog → await
-        except Exception as e:
-            LOGGER.error("Error decrypting audio file: %s", e)
+        try:
+            await _write_stream_to(temp_str, decrypted())
+        except Exception:
+            if os.path.exists(temp_str):
+                await asyncio.to_thread(os.remove, temp_str)
             raise
-
-    async def fix_audio(self) -> None:
-        """
-        Fix the decrypted audio file using FFmpeg.
+        if not valid:
+            if os.path.exists(temp_str):
+                await asyncio.to_thread(os.remove, temp_str)
+            return False
+        os.replace(temp_str, self.output_file)
+        return True
+
+    async def _stream_remux(self) -> None:
+        """Fused pipeline for encrypted tracks.
+
+        Streams the CDN body through AES-CTR decryption, patches the OGG
+        header in memory on the buffered prefix, and feeds the result
+        straight into FFmpeg's stdin. The audio touches disk exactly once,
+        as the final output file, instead of via encrypted/decrypted
+        intermediates read back for every stage.
+
+        The network reader and the stdin feeder run as separate tasks
+        joined by a small bounded queue, so fetching chunk N+1 overlaps
+        with FFmpeg consuming chunk N instead of strictly alternating.
         """
+        key = bytes.fromhex(self.track.key)
+        decryptor = Cipher(algorithms.AES(key), modes.CTR(_SPOTIFY_IV)).decryptor()
+
+        # Recycled decrypt buffers: the reader hands (buffer, length)
+        # pairs to the feeder, which returns drained buffers to the pool,
+        # so the steady state allocates nothing per chunk. update_into's
+        # extra AES block is covered by the +16.
+        chunk_cap = HttpxClient.CHUNK_SIZE + 16
+        pool: list = []
+        queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-threads",
+            "1",
+            "-i",
+            "pipe:0",
+            "-c",
+            "copy",
+            self.output_file,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+        async def produce() -> None:
+            prefix = bytearray()
+            prefix_done = False
+            async for chunk in get_shared_client().stream_chunks(self.track.cdnurl):
+                buf = pool.pop() if pool else bytearray(chunk_cap)
+                if len(buf) < len(chunk) + 16:
+                    buf = bytearray(len(chunk) + 16)
+                written = decryptor.update_into(chunk, buf)
+                if not prefix_done:
+                    prefix.extend(memoryview(buf)[:written])
+                    pool.append(buf)
+                    if len(prefix) < _OGG_PATCH_LEN:
+                        continue
+                    _patch_ogg_header(prefix)
+                    await queue.put((prefix, len(prefix)))
+                    prefix_done = True
+                    continue
+                await queue.put((buf, written))
+            decryptor.finalize()
+            if not prefix_done and prefix:
+                # Stream ended before the patch region filled; forward as-is
+                await queue.put((prefix, len(prefix)))
+            await queue.put(None)
+
+        async def feed() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                buf, length = item
+                # Returning buf to the pool right after drain is safe: the
+                # pipe transport has either flushed the bytes or copied
+                # any unsent tail into its own buffer.
+                process.stdin.write(memoryview(buf)[:length])
+                await process.stdin.drain()
+                pool.append(buf)
+
         try:
-            process = await asyncio.create_subprocess_exec(
-                "ffmpeg",
-                "-i",
-                self.decrypted_file,
-                "-c",
-                "copy",
-                self.output_file,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            tasks = [asyncio.create_task(produce()), asyncio.create_task(feed())]
+            done, pending = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION
             )
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            for task in done:
+                if exc := task.exception():
+                    raise exc
+            process.stdin.close()
             _, stderr = await process.communicate()
             if process.returncode != 0:
                 LOGGER.error("FFmpeg error: %s", stderr.decode().strip())
                 raise subprocess.CalledProcessError(process.returncode, "ffmpeg")
-        except Exception as e:
-            LOGGER.error("Error fixing audio file: %s", e)
+        except Exception:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
             raise
 
-    async def _cleanup(self) -> None:
-        """
-        Cleanup temporary files asynchronously.
-        """
-        for file in [self.encrypted_file, self.decrypted_file]:
-            try:
-                if os.path.exists(file):
-                    os.remove(file)
-            except Exception as e:
-                LOGGER.warning("Error removing %s: %s", file, e)
-
     async def process(self) -> Union[Path, types.Error]:
         """
         Main function to download, optionally decrypt, and fix audio.
         """
-        if os.path.exists(self.output_file):
+        if _produced_outputs.get(self.output_file) or os.path.exists(self.output_file):
+            _produced_outputs[self.output_file] = True
             LOGGER.info("✅ Found existing file: %s", self.output_file)
             return Path(self.output_file)
 
@@ -390,25 +734,35 @@ class SpotifyDownload:
         try:
             # Check if track has a key (indicating encrypted file)
             if self.track.key:
-                # Fallback to original encrypted OGG download process
-                download_result = await HttpxClient().download_file(self.track.cdnurl, self.encrypted_file)
-                if not download_result.success:
-                    LOGGER.warning(f"Download failed for track {_track_id}: {download_result.error}")
-                    return types.Error(500, f"Download failed: {_track_id}")
-                await self.decrypt_audio()
-                await rebuild_ogg(self.decrypted_file)
-                await self.fix_audio()
+                # Encrypted OGG: decrypt straight to disk when the stream
+                # validates; otherwise remux through FFmpeg. The semaphore
+                # bounds live FFmpeg processes; each pipeline owns its
+                # process for its whole lifetime.
+                if not await self._stream_decrypt():
+                    LOGGER.info(
+                        "OGG validation failed for %s, falling back to FFmpeg",
+                        _track_id,
+                    )
+                    async with _FFMPEG_SEM:
+                        await self._stream_remux()
             else:
                 # Direct MP3 download for Spotify
-                download_result = await HttpxClient().download_file(self.track.cdnurl, self.output_file)
+                download_result = await get_shared_client().download_file(self.track.cdnurl, self.output_file)
                 if not download_result.success:
-                    LOGGER.warning(f"Download failed for track {_track_id}: {download_result.error}")
+                    LOGGER.warning("Download failed for track %s: %s", _track_id, download_result.error)
                     return types.Error(500, f"Download failed: {_track_id}")
 
-            await self._cleanup()
+            _produced_outputs[self.output_file] = True
             LOGGER.info("✅ Successfully processed track: %s", self.output_file)
             return Path(self.output_file)
         except Exception as e:
             LOGGER.error("Error processing track %s: %s", _track_id, e)
-            await self._cleanup()
+            # Drop any partial pipeline output so the exists-gate above
+            # never serves a truncated file on retry
+            _produced_outputs.pop(self.output_file)
+            try:
+                if os.path.exists(self.output_file):
+                    os.remove(self.output_file)
+            except OSError as cleanup_error:
+                LOGGER.warning("Error removing %s: %s", self.output_file, cleanup_error)
             return types.Error(code=500, message=f"Error processing track: {_track_id}")
@@ -119,11 +119,11 @@ class JiosaavnData(MusicService):
                 if track
             ]
             return PlatformTracks(tracks=[
-                MusicTrack(**track) for track in formatted_tracks
+                MusicTrack.from_dict(track) for track in formatted_tracks
             ])
 
         except Exception as error:
-            LOGGER.error(f"JioSaavn search failed for '{self.query}': {error}")
+            LOGGER.error("JioSaavn search failed for '%s': %s", self.query, error)
             return types.Error(
                 code=500,
                 message=f"Search failed: {str(error)}"
@@ -156,7 +156,7 @@ class JiosaavnData(MusicService):
 
             return self._create_platform_tracks(data)
         except Exception as error:
-            LOGGER.error(f"Failed to get info for {self.query}: {error}")
+            LOGGER.error("Failed to get info for %s: %s", self.query, error)
             return types.Error(
                 code=500,
                 message="Failed to retrieve track information"
@@ -199,8 +199,8 @@ class JiosaavnData(MusicService):
             album=track_data.get("album", self.DEFAULT_ALBUM),
             cover=track_data.get("cover", ""),
             lyrics="None",
-            duration=track_data.get("duration", self.DEFAULT_DURATION),
-            year=track_data.get("year", self.DEFAULT_YEAR),
+            duration=int(track_data.get("duration") or self.DEFAULT_DURATION),
+            year=int(track_data.get("year") or self.DEFAULT_YEAR),
             url=track_data.get("url", ""),
             platform="jiosaavn",
         )
@@ -219,9 +219,9 @@ class JiosaavnData(MusicService):
                 info = await asyncio.to_thread(ydl.extract_info, url, download=False)
                 return {"results": [self._format_track(info)]} if info else None
         except yt_dlp.DownloadError as error:
-            LOGGER.error(f"Download error for track {url}: {error}")
+            LOGGER.error("Download error for track %s: %s", url, error)
         except Exception as error:
-            LOGGER.error(f"Unexpected error processing track {url}: {error}")
+            LOGGER.error("Unexpected error processing track %s: %s", url, error)
         return None
 
     async def get_playlist_data(self, url: str) -> Optional[dict[str, Any]]:
@@ -238,7 +238,7 @@ class JiosaavnData(MusicService):
                 info = await asyncio.to_thread(ydl.extract_info, url, download=False)
 
                 if not info or not info.get("entries"):
-                    LOGGER.warning(f"Empty playlist response for {url}")
+                    LOGGER.warning("Empty playlist response for %s", url)
                     return None
 
                 return {
@@ -249,9 +249,9 @@ class JiosaavnData(MusicService):
                     ]
                 }
         except yt_dlp.DownloadError as error:
-            LOGGER.error(f"Download error for playlist {url}: {error}")
+            LOGGER.error("Download error for playlist %s: %s", url, error)
         except Exception as error:
-            LOGGER.error(f"Unexpected error processing playlist {url}: {error}")
+            LOGGER.error("Unexpected error processing playlist %s: %s", url, error)
         return None
 
     async def download_track(
@@ -306,7 +306,7 @@ class JiosaavnData(MusicService):
             title = re.sub(r"\s+", "-", title.strip())
             return f"https://www.jiosaavn.com/song/{title}/{song_id}"
         except ValueError:
-            LOGGER.warning(f"Invalid name_and_id format: {name_and_id}")
+            LOGGER.warning("Invalid name_and_id format: %s", name_and_id)
             return ""
 
     @classmethod
@@ -372,5 +372,5 @@ class JiosaavnData(MusicService):
             )
 
         return PlatformTracks(
-            tracks=[MusicTrack(**track) for track in data["results"] if track]
+            tracks=[MusicTrack.from_dict(track) for track in data["results"] if track]
         )
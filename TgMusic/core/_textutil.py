@@ -0,0 +1,76 @@
+# Copyright (c) 2025 AshokShau
+# Licensed under the GNU AGPL v3.0: https://www.gnu.org/licenses/agpl-3.0.html
+# Part of the TgMusicBot project. All rights reserved where applicable.
+
+"""Hot-path text sanitation shared by the core modules.
+
+These helpers run for every text field of every parsed track and every
+queued song, so both keep a zero-allocation fast path for already-clean
+ASCII and do the HTML escape plus control-character strip in a single
+``str.translate`` pass.
+"""
+
+# Escapes &, <, > and drops control characters (used for API metadata)
+_ESCAPE_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        **{c: None for c in range(0x20)},
+        0x7F: None,
+    }
+)
+
+# Full html.escape()-equivalent table, quotes included (used for message text)
+_FULL_ESCAPE_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#x27;",
+        **{c: None for c in range(0x20)},
+        0x7F: None,
+    }
+)
+
+
+def sanitize_text(text: str) -> str:
+    """Sanitize API text to prevent Telegram entity parsing issues.
+
+    Escapes HTML characters and removes control characters.
+    """
+    if not text:
+        return text
+    # Fast path: most fields (titles, URLs) need no work at all
+    if (
+        text.isascii()
+        and text.isprintable()
+        and "&" not in text
+        and "<" not in text
+        and ">" not in text
+    ):
+        return text
+    return text.translate(_ESCAPE_TABLE)
+
+
+def sanitize_message_text(text: str) -> str:
+    """Sanitize message text, quotes included, capped to Telegram's limit.
+
+    Escapes HTML characters, removes control characters and truncates to
+    the 4096-character message length limit.
+    """
+    if not text:
+        return text or ""
+    # Fast path: most fields (titles, URLs) need no escaping/stripping
+    if (
+        text.isascii()
+        and text.isprintable()
+        and "&" not in text
+        and "<" not in text
+        and ">" not in text
+        and '"' not in text
+        and "'" not in text
+    ):
+        return text if len(text) <= 4096 else text[:4096]
+    return text.translate(_FULL_ESCAPE_TABLE)[:4096]
@@ -7,7 +7,6 @@ import random
 import re
 from pathlib import Path
 from typing import Optional, Union
-from html import escape
 
 from ntgcalls import TelegramServerError, ConnectionNotFound
 from pyrogram import Client as PyroClient
@@ -17,6 +16,7 @@ from pytgcalls import PyTgCalls, exceptions
 from pytgcalls.types import (
     AudioQuality,
     ChatUpdate,
+    GroupCallParticipant,
     MediaStream,
     Update,
     UpdatedGroupCallParticipant,
@@ -44,7 +44,8 @@ from ._api import ApiData
 from ._jiosaavn import JiosaavnData
 from ._youtube import YouTubeData
 from ._dataclass import CachedTrack
-from .utils import send_logger
+from ._textutil import sanitize_message_text
+from .utils import run_in_background, send_logger
 from .thumbnails import gen_thumb
 
 
@@ -54,6 +55,16 @@ class Calls:
         self.client_counter: int = 1
         self.available_clients: list[str] = []
         self.bot: Optional[Client] = None
+        # Lazily computed set of assistant user IDs (stable once the
+        # clients are started).
+        self._assistant_ids: Optional[set[int]] = None
+        # chat_id -> user IDs seen in the voice chat, maintained from
+        # pytgcalls participant updates. Lets the minutely inactivity
+        # sweep skip the get_participants RPC for chats that clearly
+        # have listeners; only a count above one is trusted, anything
+        # else falls back to the RPC (we may have joined mid-call and
+        # missed the existing participants).
+        self.vc_participants: dict[int, set[int]] = {}
 
     async def add_bot(self, bot: Client) -> types.Ok:
         self.bot = bot
@@ -152,7 +163,7 @@ class Calls:
                     if isinstance(update, stream.StreamEnded):
                         await self.play_next(update.chat_id)
                     elif isinstance(update, UpdatedGroupCallParticipant):
-                        return
+                        self._track_participant(update)
                     elif isinstance(update, ChatUpdate) and (
                         update.status.KICKED or update.status.LEFT_GROUP
                     ):
@@ -160,9 +171,29 @@ class Calls:
                             "Cleaning up chat %s after leaving", update.chat_id
                         )
                         chat_cache.clear_chat(update.chat_id)
+                        self.vc_participants.pop(update.chat_id, None)
                 except Exception as e:
                     LOGGER.error("Error in general handler: %s", e, exc_info=True)
 
+    def assistant_ids(self) -> set[int]:
+        """User IDs of the started assistant accounts."""
+        if self._assistant_ids is None and self.calls:
+            self._assistant_ids = {
+                c.mtproto_client.me.id for c in self.calls.values()
+            }
+        return self._assistant_ids or set()
+
+    def _track_participant(self, update: UpdatedGroupCallParticipant) -> None:
+        """Apply a join/leave delta to the tracked participant set."""
+        users = self.vc_participants.setdefault(update.chat_id, set())
+        if update.action in (
+            GroupCallParticipant.Action.LEFT,
+            GroupCallParticipant.Action.KICKED,
+        ):
+            users.discard(update.participant.user_id)
+        else:
+            users.add(update.participant.user_id)
+
     async def play_media(
         self,
         chat_id: int,
@@ -218,8 +249,11 @@ class Calls:
             await client.play(chat_id, _stream, call_config)
             # Send playback log if enabled
             if await db.get_logger_status(self.bot.me.id):
-                self.bot.loop.create_task(
-                    send_logger(self.bot, chat_id, chat_cache.get_playing_track(chat_id))
+                run_in_background(
+                    self.bot.loop,
+                    send_logger(
+                        self.bot, chat_id, chat_cache.get_playing_track(chat_id)
+                    ),
                 )
 
             return types.Ok()
@@ -273,20 +307,8 @@ class Calls:
         else:
             await self._handle_no_songs(chat_id)
 
-    @staticmethod
-    def _sanitize_text(text: str) -> str:
-        """Sanitize text to prevent Telegram entity parsing issues.
-
-        Escapes HTML characters and removes invalid characters.
-        """
-        if not text:
-            return text
-        # Escape HTML characters
-        text = escape(text)
-        # Remove control characters
-        text = re.sub(r"[\x00-\x1F\x7F]", "", text)
-        # Ensure text is not too long for Telegram
-        return text[:4096]  # Telegram message length limit
+    # Shared single-pass sanitizer; replaces the per-class escape + regex copy
+    _sanitize_text = staticmethod(sanitize_message_text)
 
     async def _play_song(self, chat_id: int, song: CachedTrack) -> None:
         """Internal method to play a specific song.
@@ -443,6 +465,7 @@ class Calls:
                 return client
 
             chat_cache.clear_chat(chat_id)
+            self.vc_participants.pop(chat_id, None)
 
             try:
                 await client.leave_call(chat_id)
@@ -691,7 +714,16 @@ class Calls:
             if isinstance(client, types.Error):
                 return client
 
-            return await client.get_participants(chat_id)
+            participants = await client.get_participants(chat_id)
+            # Resync the tracked set; deltas accumulated since the last
+            # full fetch may have missed pre-join participants. Skip the
+            # rebuild when the fetch matches what is already tracked —
+            # the common case once the set has converged.
+            ids = [p.user_id for p in participants]
+            prev = self.vc_participants.get(chat_id)
+            if prev is None or len(prev) != len(ids) or not prev.issuperset(ids):
+                self.vc_participants[chat_id] = set(ids)
+            return participants
         except exceptions.UnsupportedMethod:
             return types.Error(
                 code=501, message="This method is not supported by the server"
@@ -736,7 +768,7 @@ class Calls:
     ) -> Union[ChatMemberStatusResult, types.Error]:
         client = await self.get_client(chat_id)
         if isinstance(client, types.Error):
-            LOGGER.error(f"Failed to get client for chat {chat_id}")
+            LOGGER.error("Failed to get client for chat %s", chat_id)
             return client
 
         user_id = client.me.id
@@ -94,7 +94,7 @@ class YouTubeUtils:
             return PlatformTracks(tracks=[])
 
         valid_tracks = [
-            MusicTrack(**track)
+            MusicTrack.from_dict(track)
             for track in data["results"]
             if track and track.get("id")
         ]
@@ -449,13 +449,13 @@ class YouTubeData(MusicService):
                 )
 
             tracks = [
-                MusicTrack(**YouTubeUtils.format_track(video))
+                MusicTrack.from_dict(YouTubeUtils.format_track(video))
                 for video in results["result"]
             ]
             return PlatformTracks(tracks=tracks)
 
         except Exception as error:
-            LOGGER.error(f"YouTube search failed for '{self.query}': {error}")
+            LOGGER.error("YouTube search failed for '%s': %s", self.query, error)
             return types.Error(
                 code=500,
                 message=f"Search failed: {str(error)}"
@@ -532,13 +532,13 @@ class YouTubeData(MusicService):
         """
         try:
             if YouTubeUtils.YOUTUBE_PLAYLIST_PATTERN.match(url):
-                LOGGER.debug(f"Processing YouTube playlist: {url}")
+                LOGGER.debug("Processing YouTube playlist: %s", url)
                 return await self._get_playlist_data(url)
 
-            LOGGER.debug(f"Processing YouTube video: {url}")
+            LOGGER.debug("Processing YouTube video: %s", url)
             return await self._get_video_data(url)
         except Exception as error:
-            LOGGER.error(f"Data fetch failed for {url}: {error}")
+            LOGGER.error("Data fetch failed for %s: %s", url, error)
             return None
 
     @staticmethod
@@ -566,7 +566,7 @@ class YouTubeData(MusicService):
                 ]
             }
         except Exception as error:
-            LOGGER.error(f"Video data fetch failed: {error}")
+            LOGGER.error("Video data fetch failed: %s", error)
             return None
 
     @staticmethod
@@ -585,5 +585,5 @@ class YouTubeData(MusicService):
                 ]
             }
         except Exception as error:
-            LOGGER.error(f"Playlist data fetch failed: {error}")
+            LOGGER.error("Playlist data fetch failed: %s", error)
             return None
\ No newline at end of file
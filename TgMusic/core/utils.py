@@ -1,3 +1,6 @@
+import asyncio
+from typing import Coroutine
+
 from pytdbot import Client, types
 
 from ._config import config
@@ -5,6 +8,30 @@ from ._dataclass import CachedTrack
 from ..logger import LOGGER
 from ..modules.utils import sec_to_min
 
+# Strong references for fire-and-forget tasks; the event loop only keeps
+# weak refs, so an unreferenced create_task can be garbage-collected
+# mid-flight.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def run_in_background(
+    loop: asyncio.AbstractEventLoop, coro: Coroutine
+) -> asyncio.Task:
+    """
+    Schedule a coroutine without awaiting it, keeping the task alive.
+
+    Args:
+        loop (AbstractEventLoop): The loop to schedule on.
+        coro (Coroutine): The coroutine to run.
+
+    Returns:
+        The created task.
+    """
+    task = loop.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
 
 async def send_logger(client: Client, chat_id, song: CachedTrack):
     """
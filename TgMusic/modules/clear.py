@@ -31,5 +31,5 @@ async def clear_queue(c: Client, msg: types.Message) -> None:
     chat_cache.clear_chat(chat_id)
     reply = await msg.reply_text(f"✅ Queue cleared by {await msg.mention()}")
     if isinstance(reply, types.Error):
-        c.logger.warning(f"Error sending reply: {reply}")
+        c.logger.warning("Error sending reply: %s", reply)
     return None
@@ -57,7 +57,7 @@ async def handle_playback_action(
     """Handle common playback control operations."""
     _chat_id = await is_admin_or_reply(msg)
     if isinstance(_chat_id, types.Error):
-        c.logger.warning(f"⚠️ Admin check failed: {_chat_id.message}")
+        c.logger.warning("⚠️ Admin check failed: %s", _chat_id.message)
         return
 
     if isinstance(_chat_id, types.Message):
@@ -5,52 +5,122 @@
 import asyncio
 import time
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from pyrogram import Client as PyroClient
 from pyrogram import errors
 from pytdbot import Client, types
 
 from TgMusic.core import chat_cache, config, call, db
 
-_concurrency_limiter = asyncio.Semaphore(10)
+# Built once at import; the minutely job uses an interval trigger so no
+# crontab expression is evaluated on every fire.
+_TZ = ZoneInfo("Asia/Kolkata")
+_MINUTELY = IntervalTrigger(seconds=60, timezone=_TZ)
+_MIDNIGHT = CronTrigger(hour=0, minute=0, timezone=_TZ)
+_HALF_PAST = CronTrigger(minute=30, timezone=_TZ)
+
+
+class DynamicLimiter:
+    """Admission gate like asyncio.Semaphore, but resizable at runtime.
+
+    A Condition over an in-flight counter; set_limit() can raise or lower
+    the cap while waiters are queued, which a plain Semaphore cannot do
+    safely.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._cond = asyncio.Condition()
+        self._active = 0
+        self._limit = limit
+
+    async def __aenter__(self) -> "DynamicLimiter":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        async with self._cond:
+            self._limit = limit
+            self._cond.notify_all()
+
+
+_concurrency_limiter = DynamicLimiter(10)
+
+
+async def semaphore_gather(limiter, *coros, return_exceptions: bool = False):
+    """gather() with at most the limiter's cap of coroutines in flight.
+
+    Admission happens inside each wrapper, so queued work costs a paused
+    coroutine rather than an eagerly running task per chat.
+    """
+
+    async def _bounded(coro):
+        async with limiter:
+            return await coro
+
+    return await asyncio.gather(
+        *(_bounded(coro) for coro in coros), return_exceptions=return_exceptions
+    )
 
 
 class InactiveCallManager:
     def __init__(self, bot: Client):
         self.bot = bot
-        self.scheduler = AsyncIOScheduler(
-            timezone="Asia/Kolkata", event_loop=self.bot.loop
-        )
+        self.scheduler = AsyncIOScheduler(timezone=_TZ, event_loop=self.bot.loop)
+        # chat_id -> monotonic deadline before which the inactivity sweep
+        # skips the chat entirely (set after a check shows listeners or a
+        # track that has barely started).
+        self._next_check: dict[int, float] = {}
 
     async def _end_inactive_calls(self, chat_id: int):
-        async with _concurrency_limiter:
-            vc_users = await call.vc_users(chat_id)
-            if isinstance(vc_users, types.Error):
-                self.bot.logger.warning(
-                    f"An error occurred while getting vc users: {vc_users.message}"
-                )
-                return
-
-            if len(vc_users) > 1:
-                return
-            played_time = await call.played_time(chat_id)
-            if isinstance(played_time, types.Error):
-                self.bot.logger.warning(
-                    f"An error occurred while getting played time: {played_time.message}"
-                )
-                return
+        # Admission control lives in end_inactive_calls' semaphore_gather.
+        if time.monotonic() < self._next_check.get(chat_id, 0):
+            return
+        # The tracked participant set is fed by pytgcalls updates; when it
+        # already shows listeners there is no need for the RPC round-trip.
+        if len(call.vc_participants.get(chat_id, ())) > 1:
+            self._next_check[chat_id] = time.monotonic() + 120
+            return
+        vc_users = await call.vc_users(chat_id)
+        if isinstance(vc_users, types.Error):
+            self.bot.logger.warning(
+                "An error occurred while getting vc users: %s", vc_users.message
+            )
+            return
 
-            if played_time < 15:
-                return
-            _chat_id = await db.get_chat_id_by_channel(chat_id) or chat_id
-            reply = await self.bot.sendTextMessage(
-                _chat_id, "⚠️ No active listeners detected. ⏹️ Leaving voice chat..."
+        if len(vc_users) > 1:
+            # Listeners present; no point rechecking this chat for a while
+            self._next_check[chat_id] = time.monotonic() + 120
+            return
+        played_time = await call.played_time(chat_id)
+        if isinstance(played_time, types.Error):
+            self.bot.logger.warning(
+                "An error occurred while getting played time: %s", played_time.message
             )
-            if isinstance(reply, types.Error):
-                self.bot.logger.warning(f"Error sending message: {reply}")
-            await call.end(chat_id)
+            return
+
+        if played_time < 15:
+            # Too early to call it inactive; back off just long enough
+            # for the track to cross the threshold.
+            self._next_check[chat_id] = time.monotonic() + max(1, 15 - played_time)
+            return
+        _chat_id = await db.get_chat_id_by_channel(chat_id) or chat_id
+        reply = await self.bot.sendTextMessage(
+            _chat_id, "⚠️ No active listeners detected. ⏹️ Leaving voice chat..."
+        )
+        if isinstance(reply, types.Error):
+            self.bot.logger.warning("Error sending message: %s", reply)
+        await call.end(chat_id)
 
     async def end_inactive_calls(self):
         if self.bot is None or self.bot.me is None:
@@ -60,92 +130,118 @@ class InactiveCallManager:
 
         active_chats = chat_cache.get_active_chats()
         if not active_chats:
+            self._next_check.clear()
             self.bot.logger.debug("No active chats found.")
             return
 
+        # Drop backoff deadlines for chats that are no longer active
+        if self._next_check:
+            active = set(active_chats)
+            for stale in [cid for cid in self._next_check if cid not in active]:
+                del self._next_check[stale]
+
         start_time = datetime.now()
         start_monotonic = time.monotonic()
         self.bot.logger.debug(
-            f"🔄 Started end_inactive_calls at {start_time.strftime('%Y-%m-%d %H:%M:%S')}"
+            "🔄 Started end_inactive_calls at %s",
+            start_time.strftime("%Y-%m-%d %H:%M:%S"),
         )
 
         try:
-            self.bot.logger.debug(f"Checking {len(active_chats)} active chats...")
-            tasks = [self._end_inactive_calls(chat_id) for chat_id in active_chats]
-            await asyncio.gather(*tasks, return_exceptions=True)
+            self.bot.logger.debug("Checking %d active chats...", len(active_chats))
+            await semaphore_gather(
+                _concurrency_limiter,
+                *(self._end_inactive_calls(chat_id) for chat_id in active_chats),
+                return_exceptions=True,
+            )
         except Exception as e:
             self.bot.logger.error(
-                f"❗ Exception in end_inactive_calls: {e}", exc_info=True
+                "❗ Exception in end_inactive_calls: %s", e, exc_info=True
             )
         finally:
             end_time = datetime.now()
             duration = time.monotonic() - start_monotonic
             self.bot.logger.debug(
-                f"✅ Finished end_inactive_calls at {end_time.strftime('%Y-%m-%d %H:%M:%S')} "
-                f"(Duration: {duration:.2f}s)"
+                "✅ Finished end_inactive_calls at %s (Duration: %.2fs)",
+                end_time.strftime("%Y-%m-%d %H:%M:%S"),
+                duration,
             )
 
     async def leave_all(self):
         if not config.AUTO_LEAVE:
             return
 
-        for client_name, call_instance in call.calls.items():
-            ub: PyroClient = call_instance.mtproto_client
-            chats_to_leave = []
-            async for dialog in ub.get_dialogs():
-                chat = getattr(dialog, "chat", None)
-                if not chat:
-                    continue
-                if chat.id > 0:
-                    self.bot.logger.debug(
-                        f"[{client_name}] Skipping private chat: {chat.id}"
-                    )
-                    continue
-                chats_to_leave.append(chat.id)
-            self.bot.logger.debug(
-                f"[{client_name}] Found {len(chats_to_leave)} chats to leave."
-            )
+        # Each client walks its own dialogs and serves its own FloodWait
+        # sleeps; running them concurrently means one throttled client no
+        # longer stalls the rest.
+        await asyncio.gather(
+            *(
+                self._leave_for_client(client_name, call_instance)
+                for client_name, call_instance in call.calls.items()
+            ),
+            return_exceptions=True,
+        )
 
-            for chat_id in chats_to_leave:
-                is_active = chat_cache.is_active(chat_id)
-                if is_active:
-                    continue
-                try:
-                    await ub.leave_chat(chat_id)
-                    self.bot.logger.debug(f"[{client_name}] Left chat {chat_id}")
-                    await asyncio.sleep(0.5)
-                except errors.FloodWait as e:
-                    wait_time = e.value
-                    self.bot.logger.warning(
-                        f"[{client_name}] FloodWait for {wait_time}s on chat {chat_id}"
-                    )
-                    if wait_time > 100:
-                        self.bot.logger.warning(
-                            f"[{client_name}] Skipping due to long wait time."
-                        )
-                        continue
-                    await asyncio.sleep(wait_time)
-                except errors.RPCError as e:
+    async def _leave_for_client(self, client_name: str, call_instance):
+        ub: PyroClient = call_instance.mtproto_client
+        # Snapshot once; is_active per chat would rescan the cache for
+        # every dialog
+        active = set(chat_cache.get_active_chats())
+        chats_to_leave = [
+            dialog.chat.id
+            async for dialog in ub.get_dialogs()
+            if getattr(dialog, "chat", None)
+            and dialog.chat.id < 0
+            and dialog.chat.id not in active
+        ]
+        self.bot.logger.debug(
+            "[%s] Found %d chats to leave.", client_name, len(chats_to_leave)
+        )
+
+        for chat_id in chats_to_leave:
+            try:
+                await ub.leave_chat(chat_id)
+                self.bot.logger.debug("[%s] Left chat %s", client_name, chat_id)
+                await asyncio.sleep(0.5)
+            except errors.FloodWait as e:
+                wait_time = e.value
+                self.bot.logger.warning(
+                    "[%s] FloodWait for %ss on chat %s", client_name, wait_time, chat_id
+                )
+                if wait_time > 100:
                     self.bot.logger.warning(
-                        f"[{client_name}] Failed to leave chat {chat_id}: {e}"
-                    )
-                    continue
-                except Exception as e:
-                    self.bot.logger.error(
-                        f"[{client_name}] Error leaving chat {chat_id}: {e}"
+                        "[%s] Skipping due to long wait time.", client_name
                     )
                     continue
+                await asyncio.sleep(wait_time)
+            except errors.RPCError as e:
+                self.bot.logger.warning(
+                    "[%s] Failed to leave chat %s: %s", client_name, chat_id, e
+                )
+                continue
+            except Exception as e:
+                self.bot.logger.error(
+                    "[%s] Error leaving chat %s: %s", client_name, chat_id, e
+                )
+                continue
+
+        self.bot.logger.info("[%s] Leaving all chats completed.", client_name)
 
-            self.bot.logger.info(f"[{client_name}] Leaving all chats completed.")
+    async def prune_chat_cache(self):
+        removed = chat_cache.prune_inactive()
+        if removed:
+            self.bot.logger.debug("Pruned %d inactive chat cache entries.", removed)
 
     async def start_scheduler(self):
         self.scheduler.add_job(
             self.end_inactive_calls,
-            CronTrigger(minute="*/1"),
+            _MINUTELY,
             coalesce=True,
             max_instances=1,
+            misfire_grace_time=30,
         )
-        self.scheduler.add_job(self.leave_all, CronTrigger(hour=0, minute=0))
+        self.scheduler.add_job(self.leave_all, _MIDNIGHT, misfire_grace_time=30)
+        self.scheduler.add_job(self.prune_chat_cache, _HALF_PAST, misfire_grace_time=30)
         self.scheduler.start()
         self.bot.logger.info("Scheduler started.")
 
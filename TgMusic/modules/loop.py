@@ -46,4 +46,4 @@ async def modify_loop(c: Client, msg: types.Message) -> None:
         f"🔁 {action}\n" f"└ Changed by: {await msg.mention()}"
     )
     if isinstance(reply, types.Error):
-        c.logger.warning(f"⚠️ Failed to send reply: {reply.message}")
+        c.logger.warning("⚠️ Failed to send reply: %s", reply.message)
@@ -3,7 +3,6 @@
 # Part of the TgMusicBot project. All rights reserved where applicable.
 
 import re
-from html import escape
 
 from pytdbot import Client, types
 
@@ -20,6 +19,7 @@ from TgMusic.core import (
     SupportButton,
     control_buttons,
 )
+from TgMusic.core._textutil import sanitize_message_text
 from TgMusic.core.admins import is_admin, load_admin_cache
 from TgMusic.modules.utils import sec_to_min, get_audio_duration
 from TgMusic.modules.utils.play_helpers import (
@@ -31,16 +31,9 @@ from TgMusic.modules.utils.play_helpers import (
 from TgMusic.core.thumbnails import gen_thumb
 
 
-def _sanitize_text(text: str) -> str:
-    """Sanitize text to prevent Telegram entity parsing issues."""
-    if not text:
-        return ""
-    # Escape HTML characters
-    text = escape(text)
-    # Remove control characters
-    text = re.sub(r"[\x00-\x1F\x7F]", "", text)
-    # Truncate to Telegram message length limit
-    return text[:4096]
+# Shared single-pass sanitizer; replaces the escape + regex copy each
+# module used to carry.
+_sanitize_text = sanitize_message_text
 
 
 def _get_jiosaavn_url(track_id: str) -> str:
@@ -218,7 +218,9 @@ async def update_file(client: Client, update: types.UpdateFile):
     filename = meta["filename"]
     message_id = meta["message_id"]
     file_id = file.id
-    now = time.time()
+    # Monotonic: only used for deltas, and wall-clock jumps would skew
+    # the speed/ETA math on this per-update path.
+    now = time.monotonic()
 
     total = file.size or 1
     downloaded = file.local.downloaded_size
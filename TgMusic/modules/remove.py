@@ -57,5 +57,5 @@ async def remove_song(c: Client, msg: types.Message) -> None:
     )
 
     if isinstance(reply, types.Error):
-        c.logger.warning(f"Error sending reply: {reply.message}")
+        c.logger.warning("Error sending reply: %s", reply.message)
     return None
@@ -13,7 +13,7 @@ from .utils.play_helpers import del_msg
 async def skip_song(c: Client, msg: types.Message) -> None:
     chat_id = await is_admin_or_reply(msg)
     if isinstance(chat_id, types.Error):
-        c.logger.warning(f"Error sending reply: {chat_id}")
+        c.logger.warning("Error sending reply: %s", chat_id)
         return None
 
     if isinstance(chat_id, types.Message):
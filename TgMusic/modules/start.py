@@ -71,7 +71,7 @@ async def start_cmd(c: Client, message: types.Message):
         )
 
     if isinstance(reply, types.Error):
-        c.logger.warning(f"⚠️ Failed to send welcome message: {reply.message}")
+        c.logger.warning("⚠️ Failed to send welcome message: %s", reply.message)
 
     return None
 
@@ -127,7 +127,7 @@ If you have any questions or concerns about our privacy policy, feel free to con
 
     reply = await message.reply_text(text)
     if isinstance(reply, types.Error):
-        c.logger.warning(f"Error sending privacy policy message:{reply.message}")
+        c.logger.warning("Error sending privacy policy message:%s", reply.message)
     return
 
 
@@ -144,23 +144,24 @@ async def reload_cmd(c: Client, message: types.Message) -> None:
             "🚫 This command can only be used in SuperGroups only."
         )
         if isinstance(reply, types.Error):
-            c.logger.warning(f"Error sending message: {reply} for chat {chat_id}")
+            c.logger.warning("Error sending message: %s for chat %s", reply, chat_id)
         return None
 
     if user_id in rate_limit_cache:
         last_used_time = rate_limit_cache[user_id]
-        time_remaining = 180 - (datetime.now() - last_used_time).total_seconds()
+        # Monotonic so an NTP step cannot shrink or stretch the cooldown
+        time_remaining = 180 - (time.monotonic() - last_used_time)
         reply = await message.reply_text(
             f"🚫 You can use this command again in ({sec_to_min(time_remaining)} Min)"
         )
         if isinstance(reply, types.Error):
-            c.logger.warning(f"Error sending message: {reply} for chat {chat_id}")
+            c.logger.warning("Error sending message: %s for chat %s", reply, chat_id)
         return None
 
-    rate_limit_cache[user_id] = datetime.now()
+    rate_limit_cache[user_id] = time.monotonic()
     reply = await message.reply_text("🔄 Reloading...")
     if isinstance(reply, types.Error):
-        c.logger.warning(f"Error sending message: {reply} for chat {chat_id}")
+        c.logger.warning("Error sending message: %s for chat %s", reply, chat_id)
         return None
 
     ub = await call.get_client(chat_id)
@@ -189,7 +190,7 @@ async def reload_cmd(c: Client, message: types.Message) -> None:
 
     reply = await reply.edit_text(text)
     if isinstance(reply, types.Error):
-        c.logger.warning(f"Error sending message: {reply} for chat {chat_id}")
+        c.logger.warning("Error sending message: %s for chat %s", reply, chat_id)
     return None
 
 
@@ -222,7 +223,7 @@ async def ping_cmd(client: Client, message: types.Message) -> None:
     )
     done = await reply_msg.edit_text(response, disable_web_page_preview=True)
     if isinstance(done, types.Error):
-        client.logger.warning(f"Error sending message: {done}")
+        client.logger.warning("Error sending message: %s", done)
     return None
 
 
@@ -234,7 +235,7 @@ async def song_cmd(c: Client, message: types.Message):
         f"🎶 USE: <code>@axMultiDLbot {args or 'song name'}</code>"
     )
     if isinstance(reply, types.Error):
-        c.logger.warning(f"Error sending message: {reply}")
+        c.logger.warning("Error sending message: %s", reply)
 
     return
 
@@ -247,7 +248,7 @@ async def callback_query_help(c: Client, message: types.UpdateNewCallbackQuery)
     if data == "help_all":
         user = await c.getUser(message.sender_user_id)
         if isinstance(user, types.Error):
-            c.logger.warning(f"⚠️ User fetch error: {user.message}")
+            c.logger.warning("⚠️ User fetch error: %s", user.message)
             await message.answer(text="❌ Failed to load profile", show_alert=True)
             return None
 
@@ -13,7 +13,7 @@ async def stop_song(c: Client, msg: types.Message) -> None:
     """Stop the current playback and clear the queue."""
     chat_id = await is_admin_or_reply(msg)
     if isinstance(chat_id, types.Error):
-        c.logger.warning(f"Error in admin check: {chat_id.message}")
+        c.logger.warning("Error in admin check: %s", chat_id.message)
         return None
 
     if isinstance(chat_id, types.Message):
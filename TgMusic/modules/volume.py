@@ -14,7 +14,7 @@ async def volume(c: Client, msg: types.Message) -> None:
     """Adjust the playback volume (1-200%)."""
     chat_id = await is_admin_or_reply(msg)
     if isinstance(chat_id, types.Error):
-        c.logger.warning(f"⚠️ Admin check failed: {chat_id.message}")
+        c.logger.warning("⚠️ Admin check failed: %s", chat_id.message)
         return None
 
     if isinstance(chat_id, types.Message):
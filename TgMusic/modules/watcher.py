@@ -19,6 +19,13 @@ from TgMusic.core import (
 from TgMusic.logger import LOGGER
 from TgMusic.core.admins import load_admin_cache
 from TgMusic.core.buttons import add_me_markup
+from TgMusic.core._cacher import TTLMap
+from TgMusic.core.utils import run_in_background
+
+# Chats/users upserted recently; message storms in a busy chat would
+# otherwise spawn one background add_chat task per message. The database
+# layer caches too — this guard skips even the task allocation.
+_recent_upserts: TTLMap[int, bool] = TTLMap(maxsize=2048, ttl=60)
 
 
 async def handle_non_supergroup(client: Client, chat_id: int) -> None:
@@ -43,18 +50,27 @@ async def handle_non_supergroup(client: Client, chat_id: int) -> None:
     await client.leaveChat(chat_id)
 
 
+# Supergroup chat IDs are the raw supergroup ID pushed below -10**12
+# (the "-100" prefix in decimal form).
+_SUPERGROUP_OFFSET = 1_000_000_000_000
+
+
 def is_valid_supergroup(chat_id: int) -> bool:
     """
     Check if a chat ID is for a supergroup.
     """
-    return str(chat_id).startswith("-100")
+    # Integer comparison; the old str(chat_id).startswith("-100") built a
+    # throwaway string for every member update.
+    return chat_id < -_SUPERGROUP_OFFSET
 
 
 async def handle_bot_join(client: Client, chat_id: int) -> None:
     """
     Handle logic when bot is added to a new chat.
     """
-    _chat_id = int(str(chat_id)[4:]) if str(chat_id).startswith("-100") else chat_id
+    _chat_id = (
+        -(chat_id + _SUPERGROUP_OFFSET) if is_valid_supergroup(chat_id) else chat_id
+    )
     chat_info = await client.getSupergroupFullInfo(_chat_id)
 
     if isinstance(chat_info, types.Error):
@@ -95,7 +111,11 @@ async def chat_member(client: Client, update: types.UpdateChatMember) -> None:
     if chat_id > 0 or not await _validate_chat(client, chat_id):
         return None
 
-    await db.add_chat(chat_id)
+    # Fire-and-forget like new_message does; the status routing below
+    # should not wait out a DB round-trip first.
+    if chat_id not in _recent_upserts:
+        _recent_upserts[chat_id] = True
+        run_in_background(client.loop, db.add_chat(chat_id))
     new_member = update.new_chat_member.member_id
     user_id = (
         new_member.user_id
@@ -118,17 +138,21 @@ async def _validate_chat(client: Client, chat_id: int) -> bool:
     return True
 
 
+# Statuses meaning "present in the chat"; hoisted so the router does not
+# rebuild the set literals on every member-update event.
+_IN_CHAT_STATUSES = frozenset(
+    {"chatMemberStatusMember", "chatMemberStatusAdministrator"}
+)
+
+
 async def _handle_status_changes(
     client: Client, chat_id: int, user_id: int, old_status: str, new_status: str
 ) -> None:
     """Route different status change scenarios to appropriate handlers."""
-    if old_status == "chatMemberStatusLeft" and new_status in {
-        "chatMemberStatusMember",
-        "chatMemberStatusAdministrator",
-    }:
+    if old_status == "chatMemberStatusLeft" and new_status in _IN_CHAT_STATUSES:
         await _handle_join(client, chat_id, user_id)
     elif (
-        old_status in {"chatMemberStatusMember", "chatMemberStatusAdministrator"}
+        old_status in _IN_CHAT_STATUSES
         and new_status == "chatMemberStatusLeft"
     ):
         await _handle_leave_or_kick(chat_id, user_id)
@@ -203,6 +227,11 @@ async def _update_user_status_cache(
     chat_id: int, user_id: int, status: ChatMemberStatus
 ) -> None:
     """Update the user status cache if the user is the bot."""
+    # Only assistant accounts are tracked; skip the per-event client
+    # resolution (and its possible DB round-trip) for everyone else.
+    if user_id not in call.assistant_ids():
+        return
+
     ub = await call.get_client(chat_id)
     if isinstance(ub, types.Error):
         LOGGER.warning("Error getting client for chat %s: %s", chat_id, ub)
@@ -225,11 +254,11 @@ async def new_message(client: Client, update: types.UpdateNewMessage) -> None:
     chat_id = message.chat_id
     content = message.content
 
-    # Run DB operation in the background
-    if chat_id < 0:
-        client.loop.create_task(db.add_chat(chat_id))
-    else:
-        client.loop.create_task(db.add_user(chat_id))
+    # Run DB operation in the background, at most once per guard window
+    if chat_id not in _recent_upserts:
+        _recent_upserts[chat_id] = True
+        upsert = db.add_chat if chat_id < 0 else db.add_user
+        run_in_background(client.loop, upsert(chat_id))
 
     # Handle video chat events
     if isinstance(content, types.MessageVideoChatEnded):